@@ -0,0 +1,25 @@
+"""Gunicorn configuration for production deployments.
+
+Usage:
+    gunicorn -c gunicorn_conf.py run:app
+
+SMS endpoints spend most of their time waiting on the database and the SMS
+gateway, so workers use gevent and the standard library is monkey-patched
+before anything else is imported. This lets ``requests``, PyMySQL and the
+task queue threads yield on I/O instead of blocking a whole worker process.
+
+Each worker process runs its own task queue and rate limiter, so the effective
+gateway send rate is ``SMS_RATE_PER_SEC`` multiplied by the number of workers.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import multiprocessing  # noqa: E402
+import os  # noqa: E402
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:3570")
+worker_class = "gevent"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
@@ -7,13 +7,17 @@ from smspanel.extensions import db
 def migrate():
     app = create_app()
     with app.app_context():
-        # Add compound index for existing databases
-        db.session.execute(
-            db.text(
-                "CREATE INDEX IF NOT EXISTS ix_messages_user_id_created_at ON messages (user_id, created_at)"
+        # Add compound index for existing databases.
+        # On PostgreSQL build it CONCURRENTLY so writes aren't blocked; that
+        # can't run inside a transaction, hence the AUTOCOMMIT connection.
+        concurrently = "CONCURRENTLY " if db.engine.dialect.name == "postgresql" else ""
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(
+                db.text(
+                    f"CREATE INDEX {concurrently}IF NOT EXISTS ix_messages_user_id_created_at "
+                    "ON messages (user_id, created_at DESC)"
+                )
             )
-        )
-        db.session.commit()
         print("Compound index added successfully")
 
 
@@ -0,0 +1,33 @@
+"""Migration script to add recipient tally columns to the messages table."""
+
+from smspanel import create_app
+from smspanel.extensions import db
+
+
+def migrate():
+    app = create_app()
+    with app.app_context():
+        # Add the columns for existing databases
+        for column in ("recipient_count", "success_count", "failed_count"):
+            db.session.execute(
+                db.text(f"ALTER TABLE messages ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+            )
+
+        # Backfill from the recipients table
+        db.session.execute(
+            db.text(
+                "UPDATE messages SET "
+                "recipient_count = (SELECT COUNT(*) FROM recipients "
+                "WHERE recipients.message_id = messages.id), "
+                "success_count = (SELECT COUNT(*) FROM recipients "
+                "WHERE recipients.message_id = messages.id AND recipients.status = 'sent'), "
+                "failed_count = (SELECT COUNT(*) FROM recipients "
+                "WHERE recipients.message_id = messages.id AND recipients.status = 'failed')"
+            )
+        )
+        db.session.commit()
+        print("Message count columns added successfully")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,25 @@
+"""Migration script to add compound index on users table."""
+
+from smspanel import create_app
+from smspanel.extensions import db
+
+
+def migrate():
+    app = create_app()
+    with app.app_context():
+        # Add compound index for existing databases (admin user list ordering).
+        # On PostgreSQL build it CONCURRENTLY so writes aren't blocked; that
+        # can't run inside a transaction, hence the AUTOCOMMIT connection.
+        concurrently = "CONCURRENTLY " if db.engine.dialect.name == "postgresql" else ""
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(
+                db.text(
+                    f"CREATE INDEX {concurrently}IF NOT EXISTS ix_users_is_admin_username "
+                    "ON users (is_admin, username)"
+                )
+            )
+        print("Compound index added successfully")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,33 @@
+"""Migration script to store messages.job_status as a SMALLINT code."""
+
+from smspanel import create_app
+from smspanel.extensions import db
+from smspanel.models import JOB_STATUS_CODES
+
+
+def migrate():
+    app = create_app()
+    with app.app_context():
+        # Codes must match JOB_STATUS_CODES in smspanel.models
+        code_case = " ".join(
+            f"WHEN '{status.value}' THEN {code}" for status, code in JOB_STATUS_CODES.items()
+        )
+        if db.engine.dialect.name == "mysql":
+            drop_index = "DROP INDEX ix_messages_job_status ON messages"
+        else:
+            drop_index = "DROP INDEX IF EXISTS ix_messages_job_status"
+        for statement in (
+            drop_index,
+            "ALTER TABLE messages RENAME COLUMN job_status TO job_status_old",
+            "ALTER TABLE messages ADD COLUMN job_status SMALLINT",
+            f"UPDATE messages SET job_status = CASE job_status_old {code_case} END",
+            "ALTER TABLE messages DROP COLUMN job_status_old",
+            "CREATE INDEX ix_messages_job_status ON messages (job_status)",
+        ):
+            db.session.execute(db.text(statement))
+        db.session.commit()
+        print("job_status converted successfully")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -3,13 +3,15 @@
 from functools import wraps
 from typing import Callable
 
-from flask import request
+from flask import g, request
 from .responses import bad_request
 
 
 def validate_json(required_fields: list[str] | None = None):
     """Decorator to validate JSON request body has required fields.
 
+    The parsed body is stored on ``g.json_body`` for the view to reuse.
+
     Args:
         required_fields: List of required field names.
 
@@ -21,19 +23,19 @@ def validate_json(required_fields: list[str] | None = None):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             data = request.get_json()
-            if not data:
+            if not data or not isinstance(data, dict):
                 return bad_request("Request body must be valid JSON", "INVALID_JSON")
 
             if required_fields:
-                missing_fields = [
-                    field for field in required_fields if field not in data or not data[field]
-                ]
+                get = data.get
+                missing_fields = [field for field in required_fields if not get(field)]
                 if missing_fields:
                     return bad_request(
                         f"Missing required field(s): {', '.join(missing_fields)}",
                         "MISSING_FIELDS",
                     )
 
+            g.json_body = data
             return f(*args, **kwargs)
 
         return decorated_function
@@ -1,51 +1,79 @@
 """Health check endpoint for monitoring and load balancers."""
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app
 from datetime import datetime, timezone
+import orjson
 import os
+import time
 
 from smspanel import db
 
 
 api_health_bp = Blueprint("api_health", __name__)
 
+# Seconds a database check result is reused, so bursts of probes and
+# dashboard polls share one SELECT 1 instead of each checking out a connection
+DB_CHECK_TTL = 1.0
+
+_db_check_cache: dict = {"checked_at": float("-inf"), "result": None}
+
+# Serialized /health body reused for DB_CHECK_TTL, so its timestamp may be
+# up to that many seconds old
+_health_body_cache: dict = {"built_at": float("-inf"), "body": b"", "status_code": 200}
+
+# Liveness and readiness bodies never change, so they are serialized once
+_LIVE_BODY = orjson.dumps({"status": "alive"})
+_READY_BODY = orjson.dumps({"status": "ready"})
+_NOT_READY_BODY = orjson.dumps({"status": "not ready", "reason": "Database not connected"})
+
 
 @api_health_bp.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for monitoring.
 
+    The serialized body is reused for up to DB_CHECK_TTL seconds.
+
     Returns:
         JSON response with health status and system information.
     """
-    checks = {
-        "database": _check_database(),
-        "memory": _check_memory(),
-    }
+    now = time.monotonic()
+    if now - _health_body_cache["built_at"] >= DB_CHECK_TTL:
+        checks = {
+            "database": _check_database(),
+            "memory": _check_memory(),
+        }
 
-    # Determine overall status
-    all_healthy = all(check["healthy"] for check in checks.values())
-    overall_status = "healthy" if all_healthy else "unhealthy"
+        # Determine overall status
+        all_healthy = all(check["healthy"] for check in checks.values())
+        overall_status = "healthy" if all_healthy else "unhealthy"
 
-    response_data = {
-        "status": overall_status,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": _get_version(),
-        "checks": checks,
-    }
+        response_data = {
+            "status": overall_status,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "version": current_app.config.get("APP_VERSION", "smspanel-unknown"),
+            "checks": checks,
+        }
 
-    status_code = 200 if all_healthy else 503
+        _health_body_cache["body"] = orjson.dumps(response_data)
+        _health_body_cache["status_code"] = 200 if all_healthy else 503
+        _health_body_cache["built_at"] = now
 
-    return jsonify(response_data), status_code
+    body = _health_body_cache["body"]
+    status_code = _health_body_cache["status_code"]
+    return current_app.response_class(body, mimetype="application/json"), status_code
 
 
 @api_health_bp.route("/health/live", methods=["GET"])
 def liveness():
     """Simple liveness probe.
 
+    Deliberately does not touch the database, so a database outage makes
+    pods unready rather than getting them restarted.
+
     Returns:
         JSON response indicating if the app is alive.
     """
-    return jsonify({"status": "alive"}), 200
+    return current_app.response_class(_LIVE_BODY, mimetype="application/json"), 200
 
 
 @api_health_bp.route("/health/ready", methods=["GET"])
@@ -58,23 +86,31 @@ def readiness():
     db_healthy = _check_database()["healthy"]
 
     if db_healthy:
-        return jsonify({"status": "ready"}), 200
+        return current_app.response_class(_READY_BODY, mimetype="application/json"), 200
     else:
-        return jsonify({"status": "not ready", "reason": "Database not connected"}), 503
+        return current_app.response_class(_NOT_READY_BODY, mimetype="application/json"), 503
 
 
 def _check_database() -> dict:
-    """Check database connectivity.
+    """Check database connectivity, reusing a result up to DB_CHECK_TTL old.
 
     Returns:
         Health check result dictionary.
     """
+    now = time.monotonic()
+    if now - _db_check_cache["checked_at"] < DB_CHECK_TTL:
+        return _db_check_cache["result"]
+
     try:
         # Execute a simple query
         db.session.execute(db.text("SELECT 1"))
-        return {"healthy": True, "message": "Connected"}
+        result = {"healthy": True, "message": "Connected"}
     except Exception as e:
-        return {"healthy": False, "message": str(e)}
+        result = {"healthy": False, "message": str(e)}
+
+    _db_check_cache["result"] = result
+    _db_check_cache["checked_at"] = now
+    return result
 
 
 def _check_memory() -> dict:
@@ -100,18 +136,3 @@ def _check_memory() -> dict:
         return {"healthy": True, "message": "psutil not installed", "skipped": True}
     except Exception as e:
         return {"healthy": False, "message": str(e)}
-
-
-def _get_version() -> str:
-    """Get application version.
-
-    Returns:
-        Version string.
-    """
-    try:
-        from smspanel.config import config as config_dict
-
-        env = getattr(config_dict, "FLASK_ENV", "unknown")
-        return f"smspanel-{env}"
-    except Exception:
-        return "smspanel-unknown"
@@ -1,6 +1,7 @@
 """Queue status API endpoints."""
 
 from flask import Blueprint
+from sqlalchemy import case, func
 
 from smspanel.models import Message, MessageJobStatus
 from smspanel.services.queue import get_task_queue
@@ -21,22 +22,17 @@ def queue_status() -> tuple:
     queue = get_task_queue()
     limiter = get_rate_limiter()
 
-    # Count pending messages in queue (job_status = PENDING)
-    pending_count = (
-        db.session.query(Message).filter(Message.job_status == MessageJobStatus.PENDING).count()
-    )
-
-    # Count sending messages
-    sending_count = (
-        db.session.query(Message).filter(Message.job_status == MessageJobStatus.SENDING).count()
-    )
-
-    # Get oldest pending message for estimating wait time
-    oldest = (
-        db.session.query(Message)
-        .filter(Message.job_status == MessageJobStatus.PENDING)
-        .order_by(Message.created_at.asc())
-        .first()
+    # Pending/sending counts and the oldest pending message in one query,
+    # restricted to unfinished messages via the job_status index
+    is_pending = Message.job_status == MessageJobStatus.PENDING
+    pending_count, sending_count, oldest_pending_at = (
+        db.session.query(
+            func.count(case((is_pending, 1))),
+            func.count(case((Message.job_status == MessageJobStatus.SENDING, 1))),
+            func.min(case((is_pending, Message.created_at))),
+        )
+        .filter(Message.job_status.in_([MessageJobStatus.PENDING, MessageJobStatus.SENDING]))
+        .one()
     )
 
     data = {
@@ -44,7 +40,7 @@ def queue_status() -> tuple:
         "msgs_per_sec": limiter.rate_per_sec,
         "pending_messages": pending_count,
         "sending_messages": sending_count,
-        "oldest_pending_at": oldest.created_at.isoformat() if oldest else None,
+        "oldest_pending_at": oldest_pending_at,
     }
 
     return APIResponse.success(data=data)
@@ -1,9 +1,46 @@
 """API response utilities for standardized error and success responses."""
 
-from flask import jsonify
+import orjson
+from flask import Response, current_app
+from functools import lru_cache
 from typing import Any
 
 
+def _json_response(payload: Any, status_code: int) -> tuple:
+    """Serialize a payload with orjson into a JSON response.
+
+    orjson encodes datetimes natively as ISO 8601 strings.
+
+    Args:
+        payload: JSON-serializable response body.
+        status_code: HTTP status code.
+
+    Returns:
+        JSON response tuple.
+    """
+    response: Response = current_app.response_class(
+        orjson.dumps(payload), mimetype="application/json"
+    )
+    return response, status_code
+
+
+@lru_cache(maxsize=64)
+def _error_body(message: str, error_code: str | None) -> bytes:
+    """Serialize an error body, memoized since most errors reuse fixed messages.
+
+    Args:
+        message: Error message.
+        error_code: Optional machine-readable error code.
+
+    Returns:
+        JSON-encoded error body.
+    """
+    error_dict: dict[str, Any] = {"message": message}
+    if error_code:
+        error_dict["code"] = error_code
+    return orjson.dumps({"error": error_dict})
+
+
 class APIResponse:
     """Standardized API response builder."""
 
@@ -24,7 +61,7 @@ class APIResponse:
             response_dict["data"] = data
         if message:
             response_dict["message"] = message
-        return jsonify(response_dict), status_code
+        return _json_response(response_dict, status_code)
 
     @staticmethod
     def error(message: str, status_code: int = 400, error_code: str | None = None) -> tuple:
@@ -46,11 +83,10 @@ class APIResponse:
         Returns:
             JSON error response tuple.
         """
-        error_dict: dict[str, Any] = {"message": message}
-        if error_code:
-            error_dict["code"] = error_code
-
-        return jsonify({"error": error_dict}), status_code
+        response: Response = current_app.response_class(
+            _error_body(message, error_code), mimetype="application/json"
+        )
+        return response, status_code
 
 
 # Common error responses
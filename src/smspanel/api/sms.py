@@ -1,11 +1,18 @@
 """API SMS endpoints."""
 
-from flask import Blueprint, request
+import hashlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from math import ceil
+
+from flask import Blueprint, Response, current_app, g, request
+from sqlalchemy import and_, delete, func, insert, or_
 
 from smspanel import db
 from smspanel.models import User, Message, Recipient
 from smspanel.services.queue import get_task_queue
-from smspanel.utils.sms_helper import process_single_sms_task, process_bulk_sms_task
+from smspanel.utils.sms_helper import process_single_sms_task, process_bulk_sms_chunk_task
+from smspanel.utils.token_cache import get_token_cache
 from smspanel.api.responses import (
     APIResponse,
     unauthorized,
@@ -17,65 +24,280 @@ from smspanel.api.decorators import validate_json
 
 api_sms_bp = Blueprint("api_sms", __name__)
 
+# Matches the User.token column; longer values can never be valid
+MAX_TOKEN_LEN = 64
+
+# Largest page list_messages serves, whichever pagination style is used
+MAX_PER_PAGE = 100
+
+
+def get_user_id_from_token() -> int | None:
+    """Get the user ID for the request's API token.
 
-def get_user_from_token() -> User | None:
-    """Get user from API token.
+    Cached tokens are answered without touching the database. Admin views
+    invalidate tokens they change; a token changed in another process keeps
+    resolving until its cache entry expires.
 
     Returns:
-        User object or None if invalid.
+        User ID, or None if the token is missing or invalid.
     """
     auth_header = request.headers.get("Authorization")
 
     if not auth_header or not auth_header.startswith("Bearer "):
         return None
 
-    token = auth_header.split(" ")[1]
+    token = auth_header[7:].strip()
+    if not token or len(token) > MAX_TOKEN_LEN:
+        return None
+
+    cache = get_token_cache()
+    user_id = cache.get(token)
+    if user_id is not None:
+        return user_id
+
+    user_id = db.session.query(User.id).filter_by(token=token).scalar()
+    if user_id is not None:
+        cache.set(token, user_id)
+    return user_id
+
+
+def _recipient_phones_by_message(message_ids: list[int]) -> dict[int, list[str]]:
+    """Load recipient phone numbers for several messages in one query.
+
+    ``Message.recipients`` is a dynamic relationship and cannot be eager-loaded,
+    so this batches the lookup to avoid one SELECT per message.
+
+    Args:
+        message_ids: IDs of the messages to load recipients for.
+
+    Returns:
+        Mapping of message ID to its recipient phone numbers.
+    """
+    phones: dict[int, list[str]] = defaultdict(list)
+    if not message_ids:
+        return phones
+
+    rows = (
+        db.session.query(Recipient.message_id, Recipient.phone)
+        .filter(Recipient.message_id.in_(message_ids))
+        .order_by(Recipient.id)
+    )
+    for message_id, phone in rows:
+        phones[message_id].append(phone)
+    return phones
+
+
+def _encode_cursor(message: Message) -> str:
+    """Encode a message's position in the list as a keyset cursor.
+
+    Args:
+        message: Last message on the current page.
+
+    Returns:
+        Cursor string in the form ``<created_at ISO 8601>,<id>``.
+    """
+    created_at = message.created_at
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{created_at.isoformat()},{message.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a keyset cursor produced by ``_encode_cursor``.
+
+    Args:
+        cursor: Cursor string.
+
+    Returns:
+        Tuple of (created_at, message_id).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    created_at_str, _, message_id = cursor.rpartition(",")
+    created_at = datetime.fromisoformat(created_at_str)
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at, int(message_id)
+
 
-    return User.query.filter_by(token=token).first()
+def _list_messages_etag(user_id: int, page_key: str, per_page: int, rows: list[Message]) -> str:
+    """Build an ETag for a user's message list page from the rows it shows.
+
+    Only ``status`` changes after a message is created, so the IDs and
+    statuses of the fetched rows (including the one-past-the-end row that
+    decides ``next_cursor``) identify the page without any aggregate over
+    the user's other messages.
+
+    Args:
+        user_id: Owner of the messages.
+        page_key: Requested page number or cursor.
+        per_page: Requested page size.
+        rows: Messages fetched for the page.
+
+    Returns:
+        ETag value (unquoted).
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for m in rows:
+        digest.update(f"{m.id}:{m.status};".encode())
+    return f"{user_id}-{page_key}-{per_page}-{digest.hexdigest()}"
 
 
 @api_sms_bp.route("/sms", methods=["GET"])
 def list_messages() -> tuple:
     """List all messages for the authenticated user.
 
+    Passing ``cursor`` switches to keyset pagination, which skips the
+    ``COUNT(*)`` query; ``total``, ``pages`` and ``current_page`` are then
+    omitted. Page-number pagination is kept for existing clients.
+
     Query parameters:
-        page: Page number (default: 1)
-        per_page: Items per page (default: 20)
+        cursor: ``next_cursor`` from the previous page; empty for the first page
+        page: Page number (default: 1), ignored when cursor is given
+        per_page: Items per page (default: 20, at most MAX_PER_PAGE)
 
     Returns:
-        JSON response with messages list.
+        JSON response with messages list and a weak ETag, or 304 when the
+        If-None-Match header matches the current ETag.
     """
-    user = get_user_from_token()
-    if user is None:
+    user_id = get_user_id_from_token()
+    if user_id is None:
         return unauthorized()
 
+    cursor = request.args.get("cursor")
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 20, type=int)
-
-    messages = (
-        Message.query.filter_by(user_id=user.id)
-        .order_by(Message.created_at.desc())
-        .paginate(page=page, per_page=per_page, error_out=False)
+    # Same fallbacks paginate() used for out-of-range values
+    if page < 1:
+        page = 1
+    if per_page < 1:
+        per_page = 20
+    per_page = min(per_page, MAX_PER_PAGE)
+
+    # Order matches ix_messages_user_id_created_at (ties fall back to id)
+    query = Message.query.filter_by(user_id=user_id).order_by(
+        Message.created_at.desc(), Message.id.asc()
     )
 
-    return APIResponse.success(
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+        except ValueError:
+            return bad_request("Invalid cursor", "INVALID_CURSOR")
+        query = query.filter(
+            or_(
+                Message.created_at < cursor_created_at,
+                and_(Message.created_at == cursor_created_at, Message.id > cursor_id),
+            )
+        )
+    elif cursor is None:
+        query = query.offset((page - 1) * per_page)
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(per_page + 1).all()
+    items = rows[:per_page]
+    has_next = len(rows) > per_page
+
+    page_key = f"c{cursor}" if cursor is not None else f"p{page}"
+    etag = _list_messages_etag(user_id, page_key, per_page, rows)
+    if request.if_none_match.contains_weak(etag):
+        not_modified = Response(status=304)
+        not_modified.set_etag(etag, weak=True)
+        return not_modified, 304
+
+    page_info = {}
+    if cursor is None:
+        total = db.session.query(func.count(Message.id)).filter_by(user_id=user_id).scalar()
+        page_info = {
+            "total": total,
+            "pages": ceil(total / per_page),
+            "current_page": page,
+        }
+    phones = _recipient_phones_by_message([m.id for m in items])
+
+    result = APIResponse.success(
         data={
             "messages": [
                 {
                     "id": m.id,
                     "content": m.content,
                     "status": m.status,
-                    "created_at": m.created_at.isoformat(),
+                    "created_at": m.created_at,
                     "recipient_count": m.recipient_count,
-                    "recipients": [r.phone for r in m.recipients],
+                    "recipients": phones[m.id],
                 }
-                for m in messages.items
+                for m in items
             ],
-            "total": messages.total,
-            "pages": messages.pages,
-            "current_page": page,
+            "next_cursor": _encode_cursor(items[-1]) if has_next and items else None,
+            **page_info,
         }
     )
+    response, status_code = result
+    response.set_etag(etag, weak=True)
+    return response, status_code
+
+
+def _insert_pending_message(
+    user_id: int, content: str, phones: list[str]
+) -> tuple[int, list[int], datetime]:
+    """Insert a pending message and its recipients without reloading them.
+
+    Uses ``INSERT ... RETURNING`` to get the new IDs in the same round trips
+    where the database supports it, falling back to an ORM flush (e.g.
+    MySQL). The caller commits.
+
+    Args:
+        user_id: Owner of the message.
+        content: Message content.
+        phones: Recipient phone numbers.
+
+    Returns:
+        Tuple of (message_id, recipient_ids, created_at), with recipient IDs
+        in the order of ``phones``.
+    """
+    # Naive UTC, matching what the database hands back on later reads
+    created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    values = {
+        "user_id": user_id,
+        "content": content,
+        "status": "pending",
+        "created_at": created_at,
+        "recipient_count": len(phones),
+    }
+
+    if db.session.get_bind().dialect.insert_returning:
+        message_id = db.session.execute(
+            insert(Message).values(**values).returning(Message.id)
+        ).scalar_one()
+        recipient_ids = db.session.scalars(
+            insert(Recipient).returning(Recipient.id, sort_by_parameter_order=True),
+            [{"message_id": message_id, "phone": phone, "status": "pending"} for phone in phones],
+        ).all()
+    else:
+        message = Message(**values)
+        db.session.add(message)
+        db.session.flush()
+        message_id = message.id
+        recipients = [
+            Recipient(message_id=message_id, phone=phone, status="pending") for phone in phones
+        ]
+        db.session.add_all(recipients)
+        db.session.flush()
+        recipient_ids = [r.id for r in recipients]
+
+    return message_id, recipient_ids, created_at
+
+
+def _discard_pending_message(message_id: int) -> None:
+    """Delete a message that could not be queued, along with its recipients.
+
+    Args:
+        message_id: ID of the message to delete.
+    """
+    db.session.execute(delete(Recipient).where(Recipient.message_id == message_id))
+    db.session.execute(delete(Message).where(Message.id == message_id))
+    db.session.commit()
 
 
 @api_sms_bp.route("/sms", methods=["POST"])
@@ -90,38 +312,33 @@ def send_sms() -> tuple:
     Returns:
         JSON response with message details (status will be 'pending').
     """
-    user = get_user_from_token()
-    if user is None:
+    user_id = get_user_id_from_token()
+    if user_id is None:
         return unauthorized()
 
-    data = request.get_json()
+    data = g.json_body
     recipient = data.get("recipient")
     content = data.get("content")
 
-    # Create message record
-    message = Message(user_id=user.id, content=content, status="pending")
-    db.session.add(message)
-    db.session.flush()
-
-    # Create recipient record
-    recipient_record = Recipient(message_id=message.id, phone=recipient, status="pending")
-    db.session.add(recipient_record)
+    # Create message and recipient records
+    message_id, _, created_at = _insert_pending_message(user_id, content, [recipient])
     db.session.commit()
 
     # Enqueue background task
     task_queue = get_task_queue()
-    enqueued = task_queue.enqueue(process_single_sms_task, message.id, recipient)
+    enqueued = task_queue.enqueue(process_single_sms_task, message_id, recipient)
 
     if not enqueued:
+        _discard_pending_message(message_id)
         return service_unavailable()
 
     return APIResponse.success(
         data={
-            "id": message.id,
+            "id": message_id,
             "status": "pending",
             "recipient": recipient,
             "content": content,
-            "created_at": message.created_at.isoformat(),
+            "created_at": created_at,
         },
         message="SMS queued for sending",
         status_code=202,
@@ -140,11 +357,11 @@ def send_bulk_sms() -> tuple:
     Returns:
         JSON response with message details (status will be 'pending').
     """
-    user = get_user_from_token()
-    if user is None:
+    user_id = get_user_id_from_token()
+    if user_id is None:
         return unauthorized()
 
-    data = request.get_json()
+    data = g.json_body
     recipients = data.get("recipients", [])
     content = data.get("content")
 
@@ -152,32 +369,38 @@ def send_bulk_sms() -> tuple:
     if not recipients:
         return bad_request("Recipients list cannot be empty", "MISSING_FIELDS")
 
-    # Create message record
-    message = Message(user_id=user.id, content=content, status="pending")
-    db.session.add(message)
-    db.session.flush()
-
-    # Create recipient records
-    for recipient in recipients:
-        recipient_record = Recipient(message_id=message.id, phone=recipient, status="pending")
-        db.session.add(recipient_record)
+    max_recipients = current_app.config.get("SMS_BULK_MAX_RECIPIENTS", 5000)
+    if len(recipients) > max_recipients:
+        return bad_request(f"Too many recipients (maximum {max_recipients})", "TOO_MANY_RECIPIENTS")
 
+    # Create message and recipient records (recipients in a single multi-row INSERT)
+    message_id, recipient_ids, created_at = _insert_pending_message(user_id, content, recipients)
     db.session.commit()
 
-    # Enqueue background task
+    # Enqueue one task per chunk so workers send chunks in parallel and a
+    # failed task only affects its own chunk
+    chunk_size = current_app.config.get("SMS_BULK_CHUNK_SIZE", 50)
+    pairs = list(zip(recipient_ids, recipients))
     task_queue = get_task_queue()
-    enqueued = task_queue.enqueue(process_bulk_sms_task, message.id, recipients)
+    enqueued = task_queue.enqueue_many(
+        process_bulk_sms_chunk_task,
+        [
+            (message_id, pairs[offset : offset + chunk_size])
+            for offset in range(0, len(pairs), chunk_size)
+        ],
+    )
 
     if not enqueued:
+        _discard_pending_message(message_id)
         return service_unavailable()
 
     return APIResponse.success(
         data={
-            "id": message.id,
+            "id": message_id,
             "status": "pending",
             "total": len(recipients),
             "content": content,
-            "created_at": message.created_at.isoformat(),
+            "created_at": created_at,
         },
         message="Bulk SMS queued for sending",
         status_code=202,
@@ -194,11 +417,11 @@ def get_message(message_id: int) -> tuple:
     Returns:
         JSON response with message details.
     """
-    user = get_user_from_token()
-    if user is None:
+    user_id = get_user_id_from_token()
+    if user_id is None:
         return unauthorized()
 
-    message = Message.query.filter_by(id=message_id, user_id=user.id).first()
+    message = Message.query.filter_by(id=message_id, user_id=user_id).first()
     if message is None:
         return not_found("Message not found")
 
@@ -207,17 +430,15 @@ def get_message(message_id: int) -> tuple:
             "id": message.id,
             "content": message.content,
             "status": message.status,
-            "created_at": message.created_at.isoformat(),
-            "sent_at": message.sent_at.isoformat() if message.sent_at else None,
+            "created_at": message.created_at,
+            "sent_at": message.sent_at,
             "hkt_response": message.hkt_response,
             "recipient_count": message.recipient_count,
             "success_count": message.success_count,
             "failed_count": message.failed_count,
             "job_status": message.job_status,
             "queue_position": message.queue_position,
-            "estimated_complete_at": (
-                message.estimated_complete_at.isoformat() if message.estimated_complete_at else None
-            ),
+            "estimated_complete_at": message.estimated_complete_at,
         }
     )
 
@@ -232,11 +453,11 @@ def get_message_recipients(message_id: int) -> tuple:
     Returns:
         JSON response with recipient details.
     """
-    user = get_user_from_token()
-    if user is None:
+    user_id = get_user_id_from_token()
+    if user_id is None:
         return unauthorized()
 
-    message = Message.query.filter_by(id=message_id, user_id=user.id).first()
+    message = Message.query.filter_by(id=message_id, user_id=user_id).first()
     if message is None:
         return not_found("Message not found")
 
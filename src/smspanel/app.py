@@ -45,7 +45,7 @@ def create_app(config_name: Optional[str] = None) -> Flask:
         from smspanel.utils.logging import set_request_id, generate_request_id
 
         req_id = request.headers.get("X-Request-ID") or generate_request_id()
-        set_request_id(req_id)
+        g.request_id_token = set_request_id(req_id)
         g.start_time = datetime.now(timezone.utc)
 
     @app.after_request
@@ -60,6 +60,15 @@ def create_app(config_name: Optional[str] = None) -> Flask:
         log_request(request, response.status_code, duration_ms)
         return response
 
+    @app.teardown_request
+    def teardown_request(exception=None):
+        from smspanel.utils.logging import reset_request_id
+
+        # Don't let this request's ID outlive it in the serving thread
+        token = g.pop("request_id_token", None)
+        if token is not None:
+            reset_request_id(token)
+
     # Register blueprints
     _register_blueprints(app)
 
@@ -140,6 +149,9 @@ def _load_config(app: Flask, config_name: Optional[str]) -> None:
                 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_db_path}'
                 print(f"Using temporary database: {tmp_db_path}")
 
+    # Version is fixed for the life of the process, so look it up once
+    app.config["APP_VERSION"] = _get_app_version()
+
     # Initialize config service for SMS
     config_service = ConfigService(
         base_url=app.config.get("SMS_BASE_URL"),
@@ -160,6 +172,20 @@ def _load_config(app: Flask, config_name: Optional[str]) -> None:
     init_rate_limiter(rate_per_sec=rate_per_sec, burst_capacity=burst_capacity)
 
 
+def _get_app_version() -> str:
+    """Get the installed smspanel package version.
+
+    Returns:
+        Version string, e.g. ``smspanel-0.26.0``.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return f"smspanel-{version('smspanel')}"
+    except PackageNotFoundError:
+        return "smspanel-unknown"
+
+
 def _setup_logging(app: Flask) -> None:
     """Configure application logging.
 
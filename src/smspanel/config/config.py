@@ -10,6 +10,8 @@ Environment Variables:
 
     Optional (with defaults):
         ADMIN_PASSWORD - Admin user password (auto-generated if not set)
+        DB_POOL_SIZE - Persistent database connections per process (default: 10)
+        DB_MAX_OVERFLOW - Extra connections allowed above the pool size (default: 20)
 """
 
 import os
@@ -35,12 +37,21 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     # Connection Pool Settings (for MySQL in production)
-    # These are ignored by SQLite but used by MySQL/PostgreSQL
-    SQLALCHEMY_POOL_SIZE = 10
-    SQLALCHEMY_POOL_MAX_OVERFLOW = 20
+    SQLALCHEMY_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    SQLALCHEMY_POOL_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    SQLALCHEMY_POOL_TIMEOUT = 30  # Seconds to wait for a free connection
     SQLALCHEMY_POOL_RECYCLE = 3600  # Recycle connections after 1 hour
     SQLALCHEMY_POOL_PRE_PING = True  # Verify connections before use
 
+    # Flask-SQLAlchemy 3 only reads pool settings from the engine options
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": SQLALCHEMY_POOL_SIZE,
+        "max_overflow": SQLALCHEMY_POOL_MAX_OVERFLOW,
+        "pool_timeout": SQLALCHEMY_POOL_TIMEOUT,
+        "pool_recycle": SQLALCHEMY_POOL_RECYCLE,
+        "pool_pre_ping": SQLALCHEMY_POOL_PRE_PING,
+    }
+
     # SMS request timeout in seconds
     SMS_REQUEST_TIMEOUT = 30
 
@@ -51,7 +62,13 @@ class Config:
 
     # SMS Queue
     SMS_QUEUE_WORKERS = 4
+    # Counted in tasks: one per single send and one per bulk chunk
     SMS_QUEUE_MAX_SIZE = 1000
+    # Recipients per queued task for bulk sends
+    SMS_BULK_CHUNK_SIZE = 50
+    # Largest bulk send accepted; 100 chunks, so one request can take at
+    # most a tenth of the queue
+    SMS_BULK_MAX_RECIPIENTS = 5000
 
     # SMS Rate Limiting
     SMS_RATE_PER_SEC: float = 2.0
@@ -99,6 +116,8 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # In-memory SQLite runs on a StaticPool, which rejects pool sizing options
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {}
     WTF_CSRF_ENABLED = False
 
     # SMS Gateway (for testing)
@@ -106,6 +125,10 @@ class TestingConfig(Config):
     SMS_APPLICATION_ID = "test-app"
     SMS_SENDER_NUMBER = "test-sender"
 
+    # No background workers: tests run queued tasks explicitly, so nothing
+    # sends to the gateway behind a test's back
+    SMS_QUEUE_WORKERS = 0
+
 
 config = {
     "development": DevelopmentConfig,
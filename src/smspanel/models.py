@@ -44,10 +44,42 @@ class MessageJobStatus(str, Enum):
     FAILED = "failed"  # All failed
 
 
+# Stored codes for MessageJobStatus. Append new statuses; never renumber.
+JOB_STATUS_CODES = {
+    MessageJobStatus.PENDING: 0,
+    MessageJobStatus.SENDING: 1,
+    MessageJobStatus.COMPLETED: 2,
+    MessageJobStatus.PARTIAL: 3,
+    MessageJobStatus.FAILED: 4,
+}
+_JOB_STATUS_BY_CODE = {code: status for status, code in JOB_STATUS_CODES.items()}
+
+
+class JobStatusType(db.TypeDecorator):
+    """Stores MessageJobStatus as a SMALLINT code instead of a VARCHAR.
+
+    Queries and attributes still use MessageJobStatus (or its string values).
+    """
+
+    impl = db.SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return JOB_STATUS_CODES[MessageJobStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _JOB_STATUS_BY_CODE[int(value)]
+
+
 class User(UserMixin, db.Model):
     """User model for authentication."""
 
     __tablename__ = "users"
+    __table_args__ = (db.Index("ix_users_is_admin_username", "is_admin", "username"),)
 
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
@@ -86,7 +118,9 @@ class Message(db.Model):
     """Message model for SMS messages."""
 
     __tablename__ = "messages"
-    __table_args__ = (db.Index("ix_messages_user_id_created_at", "user_id", "created_at"),)
+    __table_args__ = (
+        db.Index("ix_messages_user_id_created_at", "user_id", db.text("created_at DESC")),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -99,30 +133,19 @@ class Message(db.Model):
     hkt_response = db.Column(db.Text, nullable=True)
     # Job tracking fields for bulk send status
     job_status = db.Column(
-        db.String(20), default=MessageJobStatus.PENDING, index=True
+        JobStatusType, default=MessageJobStatus.PENDING, index=True
     )  # See MessageJobStatus enum
     queue_position = db.Column(db.Integer, nullable=True)  # NULL when sending
     estimated_complete_at = db.Column(db.DateTime, nullable=True)
+    # Recipient tallies, incremented in place as recipient statuses change
+    recipient_count = db.Column(db.Integer, default=0, nullable=False)
+    success_count = db.Column(db.Integer, default=0, nullable=False)
+    failed_count = db.Column(db.Integer, default=0, nullable=False)
 
     recipients = db.relationship(
         "Recipient", backref="message", lazy="dynamic", cascade="all, delete-orphan"
     )
 
-    @property
-    def recipient_count(self) -> int:
-        """Get the total number of recipients."""
-        return self.recipients.count()
-
-    @property
-    def success_count(self) -> int:
-        """Get the number of successfully sent SMS."""
-        return self.recipients.filter_by(status=RecipientStatus.SENT).count()
-
-    @property
-    def failed_count(self) -> int:
-        """Get the number of failed SMS."""
-        return self.recipients.filter_by(status=RecipientStatus.FAILED).count()
-
     @property
     def is_complete(self) -> bool:
         """Check if message sending is complete."""
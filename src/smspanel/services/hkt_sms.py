@@ -1,6 +1,10 @@
 """SMS service for sending SMS messages."""
 
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -14,6 +18,12 @@ from smspanel.config import ConfigService, SMSConfig
 # Request timeout in seconds for SMS gateway requests
 SMS_REQUEST_TIMEOUT = 30
 
+# Keep-alive connections held open to the SMS gateway
+SMS_POOL_SIZE = 32
+
+# Maximum gateway requests in flight at once during a bulk send
+SMS_BULK_CONCURRENCY = 8
+
 
 class SMSError(Exception):
     """Exception raised for SMS service errors."""
@@ -21,17 +31,55 @@ class SMSError(Exception):
     pass
 
 
+# Send small request bodies immediately and keep idle pooled connections alive
+SMS_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter that applies ``SMS_SOCKET_OPTIONS`` to new connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", SMS_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session(pool_size: int = SMS_POOL_SIZE) -> requests.Session:
+    """Create an HTTP session that reuses connections to the SMS gateway.
+
+    Retries stay with tenacity on ``send_single``, so the adapter does not retry.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host.
+
+    Returns:
+        Configured requests Session.
+    """
+    session = requests.Session()
+    adapter = _SocketOptionsAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class HKTSMSService:
     """Service for interacting with SMS API."""
 
-    def __init__(self, config_service: ConfigService):
+    def __init__(
+        self, config_service: ConfigService, bulk_concurrency: int = SMS_BULK_CONCURRENCY
+    ):
         """Initialize SMS service.
 
         Args:
             config_service: Configuration service for SMS settings.
+            bulk_concurrency: Maximum concurrent gateway requests in ``send_bulk``.
         """
         self.config_service = config_service
+        self.bulk_concurrency = bulk_concurrency
         self._config: Optional[SMSConfig] = None
+        self.session = _create_session()
 
     def _get_config(self) -> SMSConfig:
         """Get SMS configuration from config service."""
@@ -75,7 +123,7 @@ class HKTSMSService:
                 # Explicitly disable proxy for mock_sms connections
                 proxies = {"http": None, "https": None}
             
-            response = requests.post(
+            response = self.session.post(
                 config.base_url,
                 data=data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -103,6 +151,9 @@ class HKTSMSService:
     def send_bulk(self, recipients: list[str], message: str) -> Dict[str, any]:
         """Send SMS messages to multiple recipients.
 
+        Up to ``bulk_concurrency`` requests are in flight at once over the
+        pooled session. Results keep the order of ``recipients``.
+
         Args:
             recipients: List of phone numbers
             message: SMS content (supports UTF-8)
@@ -110,18 +161,21 @@ class HKTSMSService:
         Returns:
             Dict with overall status and individual results.
         """
-        results = []
 
-        for recipient in recipients:
+        def send_one(recipient: str) -> Dict[str, any]:
             result = self.send_single(recipient, message)
-            results.append(
-                {
-                    "recipient": recipient,
-                    "success": result["success"],
-                    "error": result.get("error"),
-                    "response": result.get("response_text"),
-                }
-            )
+            return {
+                "recipient": recipient,
+                "success": result["success"],
+                "error": result.get("error"),
+                "response": result.get("response_text"),
+            }
+
+        results = []
+        if recipients:
+            max_workers = min(self.bulk_concurrency, len(recipients))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(send_one, recipients))
 
         # Determine overall success
         all_success = all(r["success"] for r in results)
@@ -5,7 +5,7 @@ import queue
 import threading
 from typing import Optional
 
-from smspanel.models import Message, MessageJobStatus, RecipientStatus
+from smspanel.models import Message, MessageJobStatus
 from smspanel.utils.database import db_transaction
 from smspanel.utils.rate_limiter import RateLimiter, get_rate_limiter
 
@@ -13,7 +13,7 @@ from smspanel.utils.rate_limiter import RateLimiter, get_rate_limiter
 logger = logging.getLogger(__name__)
 
 # Task function names that handle message sending
-SMS_TASK_NAMES = frozenset({"process_single_sms_task", "process_bulk_sms_task"})
+SMS_TASK_NAMES = frozenset({"process_single_sms_task", "process_bulk_sms_chunk_task"})
 
 
 class TaskQueue:
@@ -27,6 +27,8 @@ class TaskQueue:
             max_queue_size: Maximum number of tasks to queue.
         """
         self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # Serializes producers so enqueue_many's room check holds while it puts
+        self._enqueue_lock = threading.Lock()
         self.workers: list[threading.Thread] = []
         self.num_workers = num_workers
         self.running = False
@@ -53,12 +55,33 @@ class TaskQueue:
             True if task was enqueued, False if queue is full.
         """
         try:
-            self.queue.put((task_func, args, kwargs), block=False)
+            with self._enqueue_lock:
+                self.queue.put_nowait((task_func, args, kwargs))
             return True
         except queue.Full:
             logger.warning("Task queue is full, rejecting task")
             return False
 
+    def enqueue_many(self, task_func, args_list: list[tuple]) -> bool:
+        """Add several tasks to the queue, all or none.
+
+        Args:
+            task_func: Function to execute for each task.
+            args_list: Positional arguments for each task.
+
+        Returns:
+            True if every task was enqueued, False if the queue lacks room for all.
+        """
+        q = self.queue
+        with self._enqueue_lock:
+            # Workers only take tasks off, so the room seen here cannot shrink
+            if q.maxsize > 0 and q.maxsize - q.qsize() < len(args_list):
+                logger.warning("Task queue is full, rejecting tasks")
+                return False
+            for args in args_list:
+                q.put_nowait((task_func, args, {}))
+        return True
+
     def _worker_loop(self, worker_id: int):
         """Main worker loop for processing tasks.
 
@@ -147,11 +170,10 @@ class TaskQueue:
             if not message:
                 return
 
-            success_count = message.recipients.filter_by(status=RecipientStatus.SENT).count()
-            failed_count = message.recipients.filter_by(status=RecipientStatus.FAILED).count()
-            pending_count = message.recipients.filter_by(status=RecipientStatus.PENDING).count()
+            success_count = message.success_count
+            failed_count = message.failed_count
 
-            if pending_count > 0:
+            if success_count + failed_count < message.recipient_count:
                 # Still pending recipients, keep SENDING status
                 return
 
@@ -238,10 +260,6 @@ def init_task_queue(app, num_workers: int = 4, max_queue_size: int = 1000):
     # Set up rate limiter for workers
     _task_queue.rate_limiter = get_rate_limiter()
 
-    # Start workers immediately
+    # Start workers immediately. They are daemon threads, so they are
+    # cleaned up on process exit.
     _task_queue.start()
-
-    # Clean up on shutdown
-    @app.teardown_appcontext
-    def shutdown_workers(exception=None):
-        pass  # Workers are daemon threads, they'll be cleaned up on process exit
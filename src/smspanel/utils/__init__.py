@@ -1,3 +1,10 @@
 """Utility modules for the SMS application."""
 
-__all__ = ["admin", "database", "sms_helper", "validation"]
+__all__ = [
+    "admin",
+    "database",
+    "sms_helper",
+    "token_cache",
+    "ttl_cache",
+    "validation",
+]
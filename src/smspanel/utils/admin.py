@@ -12,17 +12,22 @@ from smspanel.constants.messages import (
 )
 
 
-def get_user_or_redirect(user_id: int, redirect_route: str = "web.web_admin.users"):
+def get_user_or_redirect(
+    user_id: int, redirect_route: str = "web.web_admin.users", lock: bool = False
+):
     """Get user by ID or redirect with error if not found.
 
     Args:
         user_id: User ID to look up.
         redirect_route: Route name to redirect to if user not found.
+        lock: Select the row with FOR UPDATE so concurrent admin actions on
+            the same user serialize. Call inside ``db_transaction()`` so the
+            lock is held until commit. Ignored by SQLite.
 
     Returns:
         User object or redirect response.
     """
-    user = db.session.get(User, user_id)
+    user = db.session.get(User, user_id, with_for_update=lock or None)
     if not user:
         flash(AUTH_USER_NOT_FOUND, "error")
         return redirect(url_for(redirect_route))
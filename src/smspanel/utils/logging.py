@@ -1,37 +1,44 @@
 """Standardized logging utilities."""
 
 import logging
-import uuid
+import secrets
+from contextvars import ContextVar, Token
 from typing import Any, Optional
 
 from flask import Flask, Request
 
 
-# Request ID context variable
-_request_id_context: Optional[str] = None
+# Request ID for the current request. Each thread (or greenlet) has its own
+# context, so concurrent requests and queue workers never see each other's IDs.
+_request_id: ContextVar[str] = ContextVar("request_id", default="N/A")
 
 
 def get_request_id() -> str:
     """Get current request ID or return N/A if not set."""
-    global _request_id_context
-    return _request_id_context or "N/A"
+    return _request_id.get()
 
 
-def set_request_id(request_id: str) -> None:
-    """Set request ID for context."""
-    global _request_id_context
-    _request_id_context = request_id
+def set_request_id(request_id: str) -> Token:
+    """Set request ID for context.
 
+    Returns:
+        Token that ``reset_request_id`` uses to restore the previous ID.
+    """
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    """Restore the request ID that was current before ``set_request_id``.
 
-def clear_request_id() -> None:
-    """Clear request ID context (useful for test cleanup)."""
-    global _request_id_context
-    _request_id_context = None
+    Args:
+        token: Token returned by ``set_request_id``.
+    """
+    _request_id.reset(token)
 
 
 def generate_request_id() -> str:
     """Generate a unique request ID."""
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 
 def setup_app_logging(app: Flask) -> None:
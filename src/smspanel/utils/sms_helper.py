@@ -65,6 +65,59 @@ def create_recipient_records(message_id: int, phone_numbers: list[str]) -> None:
     for phone in phone_numbers:
         recipient_record = Recipient(message_id=message_id, phone=phone, status="pending")
         db.session.add(recipient_record)
+    increment_message_counts(message_id, recipients=len(phone_numbers))
+
+
+def increment_message_counts(
+    message_id: int, recipients: int = 0, sent: int = 0, failed: int = 0
+) -> None:
+    """Atomically add to a message's recipient tallies.
+
+    Increments happen in the UPDATE itself, so concurrent workers never
+    overwrite each other's counts.
+
+    Args:
+        message_id: Message ID.
+        recipients: Number of recipients added.
+        sent: Number of recipients newly sent.
+        failed: Number of recipients newly failed.
+    """
+    Message.query.filter_by(id=message_id).update(
+        {
+            Message.recipient_count: Message.recipient_count + recipients,
+            Message.success_count: Message.success_count + sent,
+            Message.failed_count: Message.failed_count + failed,
+        }
+    )
+
+
+def update_recipient_statuses(
+    message_id: int, recipient_ids: list[int], results: list[dict[str, Any]]
+) -> None:
+    """Update recipient statuses from per-recipient send results.
+
+    Args:
+        message_id: Message ID.
+        recipient_ids: Recipient row IDs, in the same order as ``results``.
+        results: Per-recipient results from HKT SMS service.
+    """
+    mappings = []
+    sent = 0
+    for recipient_id, recipient_result in zip(recipient_ids, results):
+        if recipient_result["success"]:
+            mappings.append({"id": recipient_id, "status": "sent"})
+            sent += 1
+        else:
+            mappings.append(
+                {
+                    "id": recipient_id,
+                    "status": "failed",
+                    "error_message": recipient_result.get("error", "Unknown error"),
+                }
+            )
+    # One executemany UPDATE for all recipients
+    db.session.bulk_update_mappings(Recipient, mappings)
+    increment_message_counts(message_id, sent=sent, failed=len(mappings) - sent)
 
 
 def update_message_status_from_result(message: Message, result: dict[str, Any]) -> None:
@@ -79,14 +132,35 @@ def update_message_status_from_result(message: Message, result: dict[str, Any])
     if all_sent:
         message.sent_at = datetime.now(timezone.utc)
 
-    # Update individual recipient statuses
-    for i, recipient_result in enumerate(result["results"]):
-        recipient_record = message.recipients[i]
-        if recipient_result["success"]:
-            recipient_record.status = "sent"
-        else:
-            recipient_record.status = "failed"
-            recipient_record.error_message = recipient_result.get("error", "Unknown error")
+    # Results follow the order the recipients were created in
+    recipient_ids = [
+        recipient_id
+        for (recipient_id,) in db.session.query(Recipient.id)
+        .filter_by(message_id=message.id)
+        .order_by(Recipient.id)
+    ]
+    update_recipient_statuses(message.id, recipient_ids, result["results"])
+
+
+def finalize_message_status(message: Message) -> None:
+    """Set message status from its recipients once none are pending.
+
+    Used when recipients are sent in several chunks; whichever chunk finishes
+    last sees no pending recipients and sets the final status.
+
+    Args:
+        message: Message to update.
+    """
+    successful = message.success_count
+    failed = message.failed_count
+    if successful + failed < message.recipient_count:
+        return
+
+    if successful and not failed:
+        message.status = "sent"
+        message.sent_at = datetime.now(timezone.utc)
+    else:
+        message.status = "partial" if successful > 0 else "failed"
 
 
 def update_single_sms_status(
@@ -104,10 +178,12 @@ def update_single_sms_status(
         message.sent_at = datetime.now(timezone.utc)
         message.hkt_response = result.get("response_text", "")
         recipient.status = "sent"
+        increment_message_counts(message.id, sent=1)
     else:
         message.status = "failed"
         recipient.status = "failed"
         recipient.error_message = result.get("error", "Unknown error")
+        increment_message_counts(message.id, failed=1)
 
 
 def get_flash_message_from_result(result: dict[str, Any]) -> tuple[str, str]:
@@ -156,20 +232,26 @@ def process_single_sms_task(message_id: int, recipient: str) -> None:
     db.session.commit()
 
 
-def process_bulk_sms_task(message_id: int, recipients: list[str]) -> None:
-    """Background task to send bulk SMS.
+def process_bulk_sms_chunk_task(message_id: int, recipients: list[tuple[int, str]]) -> None:
+    """Background task to send one chunk of a bulk SMS.
 
     Args:
         message_id: Message ID in database.
-        recipients: List of phone numbers to send to.
+        recipients: (recipient ID, phone number) pairs in this chunk.
     """
-    message = Message.query.get(message_id)
+    message = db.session.get(Message, message_id)
     if not message:
         logger.error(f"Message {message_id} not found")
         return
 
     sms_service = get_sms_service()
-    result = sms_service.send_bulk(recipients, message.content)
+    recipient_ids = [recipient_id for recipient_id, _ in recipients]
+    phones = [phone for _, phone in recipients]
+    result = sms_service.send_bulk(phones, message.content)
+
+    update_recipient_statuses(message_id, recipient_ids, result["results"])
+    db.session.commit()
 
-    update_message_status_from_result(message, result)
+    # Checked after committing so concurrent chunks see each other's results
+    finalize_message_status(message)
     db.session.commit()
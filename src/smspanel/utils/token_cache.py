@@ -0,0 +1,32 @@
+"""In-process TTL cache mapping API tokens to user IDs."""
+
+from smspanel.utils.ttl_cache import TTLCache
+
+
+class TokenCache(TTLCache):
+    """Thread-safe TTL cache of API token to user ID.
+
+    Entries expire after ``ttl`` seconds so tokens regenerated in another
+    process stop resolving within that window. When full, the oldest entry
+    is evicted.
+
+    Args:
+        maxsize: Maximum number of cached tokens (default: 10000).
+        ttl: Seconds an entry stays valid (default: 60.0).
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
+# Global token cache shared by API requests and admin token changes
+_token_cache = TokenCache()
+
+
+def get_token_cache() -> TokenCache:
+    """Get the global token cache instance.
+
+    Returns:
+        The global TokenCache instance.
+    """
+    return _token_cache
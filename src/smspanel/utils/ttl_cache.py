@@ -0,0 +1,71 @@
+"""Thread-safe in-process TTL cache."""
+
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    When full, the oldest entry is evicted.
+
+    Args:
+        maxsize: Maximum number of cached entries.
+        ttl: Seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if the key is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, key: Optional[Hashable]) -> None:
+        """Remove a key from the cache.
+
+        Args:
+            key: Cache key to forget. None is ignored.
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -26,6 +26,7 @@ from smspanel.utils.admin import (
     validate_passwords_match,
 )
 from smspanel.utils.database import db_transaction
+from smspanel.utils.token_cache import get_token_cache
 
 web_admin_bp = Blueprint("web_admin", __name__, url_prefix="/admin")
 
@@ -130,18 +131,18 @@ def change_password(user_id):
 @admin_required
 def toggle_active(user_id):
     """Toggle user active status (enable/disable)."""
-    user = get_user_or_redirect(user_id)
-    if isinstance(user, Response):
-        return user
+    with db_transaction():
+        user = get_user_or_redirect(user_id, lock=True)
+        if isinstance(user, Response):
+            return user
 
-    # Prevent disabling self
-    check_result = check_self_action_allowed(user, "disable")
-    if isinstance(check_result, Response):
-        return check_result
+        # Prevent disabling self
+        check_result = check_self_action_allowed(user, "disable")
+        if isinstance(check_result, Response):
+            return check_result
 
-    user.is_active = not user.is_active
-    with db_transaction() as session:
-        session.add(user)
+        user.is_active = not user.is_active
+    get_token_cache().invalidate(user.token)
 
     message = USER_ENABLED if user.is_active else USER_DISABLED
     flash(message.format(username=user.username), "success")
@@ -153,24 +154,26 @@ def toggle_active(user_id):
 @admin_required
 def delete_user(user_id):
     """Delete a user."""
-    user = get_user_or_redirect(user_id)
-    if isinstance(user, Response):
-        return user
+    with db_transaction() as session:
+        user = get_user_or_redirect(user_id, lock=request.method == "POST")
+        if isinstance(user, Response):
+            return user
 
-    # Prevent deleting self
-    check_result = check_self_action_allowed(user, "delete")
-    if isinstance(check_result, Response):
-        return check_result
+        # Prevent deleting self
+        check_result = check_self_action_allowed(user, "delete")
+        if isinstance(check_result, Response):
+            return check_result
 
-    if request.method == "POST":
-        username = user.username
-        with db_transaction() as session:
-            session.delete(user)
+        if request.method != "POST":
+            return render_template("admin/delete_user.html", user=user)
 
-        flash(USER_DELETED.format(username=username), "success")
-        return redirect(url_for("web.web_admin.users"))
+        username = user.username
+        token = user.token
+        session.delete(user)
+    get_token_cache().invalidate(token)
 
-    return render_template("admin/delete_user.html", user=user)
+    flash(USER_DELETED.format(username=username), "success")
+    return redirect(url_for("web.web_admin.users"))
 
 
 @web_admin_bp.route("/users/<int:user_id>/regenerate_token", methods=["POST"])
@@ -178,13 +181,14 @@ def delete_user(user_id):
 @admin_required
 def regenerate_token(user_id):
     """Regenerate the API token for a user."""
-    user = get_user_or_redirect(user_id)
-    if isinstance(user, Response):
-        return user
+    with db_transaction():
+        user = get_user_or_redirect(user_id, lock=True)
+        if isinstance(user, Response):
+            return user
 
-    user.token = User.generate_token()
-    with db_transaction() as session:
-        session.add(user)
+        old_token = user.token
+        user.token = User.generate_token()
+    get_token_cache().invalidate(old_token)
 
     flash(USER_TOKEN_REGENERATED.format(username=user.username), "success")
     return redirect(url_for("web.web_admin.users"))
@@ -14,8 +14,13 @@ web_auth_bp = Blueprint("web_auth", __name__)
 
 
 @login_manager.user_loader
-def load_user(user_id: int):
-    """Load user by ID for Flask-Login."""
+def load_user(user_id: str):
+    """Load user by ID for Flask-Login.
+
+    Flask-Login passes the ID from the session as a string. It is converted
+    to int so the primary key matches the identity map and an already-loaded
+    user is returned without a SELECT.
+    """
     return db.session.get(User, int(user_id))
 
 
@@ -1,15 +1,45 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+import queue
 import uuid
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from werkzeug.security import generate_password_hash
+
 from smspanel import create_app, db
 from smspanel.models import User, Message, Recipient
+from smspanel.services.queue import get_task_queue
+
+
+def pytest_sessionstart(session):
+    """Fail fast if two test modules share a basename.
+
+    Duplicate modules either break collection or run the same tests twice.
+    """
+    names = Counter(path.name for path in Path(__file__).parent.rglob("test_*.py"))
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise pytest.UsageError(f"Duplicate test module names: {', '.join(duplicates)}")
+
+
+@pytest.fixture(scope="session")
+def _session_app():
+    """Create the test application once for the whole test session."""
+    return create_app("testing")
 
 
 @pytest.fixture(scope="function")
-def app():
-    """Create and configure a test application instance."""
-    app = create_app("testing")
+def app(_session_app):
+    """Provide the shared test application with fresh tables for each test.
+
+    Config changes made by a test are rolled back afterwards, and tasks it
+    enqueued are dropped since testing runs no queue workers.
+    """
+    app = _session_app
+    config = dict(app.config)
 
     with app.app_context():
         db.create_all()
@@ -17,6 +47,21 @@ def app():
         db.session.remove()
         db.drop_all()
 
+    app.config.clear()
+    app.config.update(config)
+    _drain_task_queue()
+
+
+def _drain_task_queue():
+    """Discard tasks left on the shared task queue."""
+    task_queue = get_task_queue().queue
+    while True:
+        try:
+            task_queue.get_nowait()
+        except queue.Empty:
+            return
+        task_queue.task_done()
+
 
 @pytest.fixture
 def client(app):
@@ -30,6 +75,12 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@lru_cache(maxsize=None)
+def _password_hash(password: str) -> str:
+    """Hash a test password once per session; hashing is deliberately slow."""
+    return generate_password_hash(password)
+
+
 def _create_test_user(app, username="testuser", password="testpass123"):
     """Helper to create a test user with API token."""
     with app.app_context():
@@ -39,7 +90,7 @@ def _create_test_user(app, username="testuser", password="testpass123"):
             username = f"{username}_{uuid.uuid4().hex[:8]}"
 
         user = User(username=username)
-        user.set_password(password)
+        user.password_hash = _password_hash(password)
         user.token = User.generate_token()  # Generate API token
         db.session.add(user)
         db.session.commit()
@@ -82,14 +133,20 @@ def test_message(app):
             user_id = user.id
         else:
             user = User(username=username)
-            user.set_password(password)
+            user.password_hash = _password_hash(password)
             user.token = User.generate_token()
             db.session.add(user)
             db.session.commit()
             user_id = user.id
 
         # Create message
-        message = Message(user_id=user_id, content="Test message", status="sent")
+        message = Message(
+            user_id=user_id,
+            content="Test message",
+            status="sent",
+            recipient_count=1,
+            success_count=1,
+        )
         db.session.add(message)
         db.session.flush()
 
@@ -1,7 +1,9 @@
 """Mock SMS API for testing."""
 
+import os
 import random
 import time
+from typing import Callable
 
 
 class MockSMSResponse:
@@ -20,21 +22,42 @@ class MockSMSResponse:
 
 
 class MockHKTPost:
-    """Mock requests.post function for SMS API."""
+    """Mock requests.Session.post function for SMS API.
 
-    def __init__(self, failure_rate: float = 0.1, min_delay: float = 0.5, max_delay: float = 5.0):
+    Delays default to 0.5-5.0s to mimic the real gateway, except under pytest
+    where they default to zero. Pass ``sleep`` to observe delays without
+    actually waiting, and ``seed`` for a reproducible failure pattern.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.1,
+        min_delay: float | None = None,
+        max_delay: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: int | None = None,
+    ):
+        under_pytest = "PYTEST_CURRENT_TEST" in os.environ
         self.failure_rate = failure_rate
-        self.min_delay = min_delay
-        self.max_delay = max_delay
+        self.min_delay = min_delay if min_delay is not None else (0.0 if under_pytest else 0.5)
+        self.max_delay = max_delay if max_delay is not None else (0.0 if under_pytest else 5.0)
+        self.sleep = sleep
+        # Own generator: no shared module-level state, reproducible with a seed
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def for_unit_tests(cls) -> "MockHKTPost":
+        """Create a mock that always succeeds immediately."""
+        return cls(failure_rate=0.0, min_delay=0.0, max_delay=0.0)
 
     def __call__(self, *args, **kwargs):
         """Simulate SMS API call."""
         # Simulate network delay
-        delay = random.uniform(self.min_delay, self.max_delay)
-        time.sleep(delay)
+        if self.max_delay > 0:
+            self.sleep(self._rng.uniform(self.min_delay, self.max_delay))
 
         # Simulate random failures
-        if random.random() < self.failure_rate:
+        if self._rng.random() < self.failure_rate:
             from requests.exceptions import RequestException
 
             raise RequestException("Simulated SMS API failure")
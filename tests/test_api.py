@@ -36,6 +36,14 @@ class TestSMSAPI:
         assert data["data"]["total"] >= 1
         assert len(data["data"]["messages"]) >= 1
 
+    def test_list_messages_includes_recipients(self, client, auth_headers, test_message):
+        """Test listed messages carry their recipient phones and count."""
+        response = client.get("/api/sms", headers=auth_headers)
+        assert response.status_code == 200
+        listed = {m["id"]: m for m in response.json["data"]["messages"]}
+        assert listed[test_message.id]["recipients"] == ["85212345678"]
+        assert listed[test_message.id]["recipient_count"] == 1
+
     def test_send_sms_unauthorized(self, client):
         """Test sending SMS without authorization."""
         response = client.post(
@@ -48,6 +56,17 @@ class TestSMSAPI:
         assert isinstance(data["error"], dict)
         assert "code" in data["error"]
 
+    def test_list_messages_token_with_extra_spaces(self, client, auth_headers):
+        """Test surrounding whitespace in the bearer token is ignored."""
+        token = auth_headers["Authorization"][len("Bearer ") :]
+        response = client.get("/api/sms", headers={"Authorization": f"Bearer   {token} "})
+        assert response.status_code == 200
+
+    def test_list_messages_overlong_token(self, client):
+        """Test a token longer than any issued token is rejected."""
+        response = client.get("/api/sms", headers={"Authorization": "Bearer " + "x" * 65})
+        assert response.status_code == 401
+
     def test_send_sms_missing_fields(self, client, auth_headers):
         """Test sending SMS with missing fields."""
         response = client.post("/api/sms", json={"recipient": "85212345678"}, headers=auth_headers)
@@ -90,6 +109,70 @@ class TestSMSAPI:
         assert isinstance(data["error"], dict)
         assert "code" in data["error"]
 
+    def test_send_bulk_sms_creates_recipients(self, client, auth_headers):
+        """Test bulk send persists one recipient row per phone number."""
+        recipients = ["85212345678", "85287654321", "85211112222"]
+        response = client.post(
+            "/api/sms/send-bulk",
+            json={"recipients": recipients, "content": "Bulk test"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 202
+        message_id = response.json["data"]["id"]
+
+        rows = Recipient.query.filter_by(message_id=message_id).order_by(Recipient.id).all()
+        assert [r.phone for r in rows] == recipients
+
+    def test_send_bulk_sms_chunks_carry_recipient_ids(self, app, client, auth_headers):
+        """Test each queued chunk names the recipient rows it updates."""
+        from unittest.mock import patch
+
+        from smspanel.services.queue import get_task_queue
+
+        app.config["SMS_BULK_CHUNK_SIZE"] = 2
+        recipients = ["85212345678", "85287654321", "85211112222"]
+        with patch.object(get_task_queue(), "enqueue_many", return_value=True) as mock_enqueue:
+            response = client.post(
+                "/api/sms/send-bulk",
+                json={"recipients": recipients, "content": "Bulk test"},
+                headers=auth_headers,
+            )
+        assert response.status_code == 202
+        message_id = response.json["data"]["id"]
+
+        chunks = mock_enqueue.call_args.args[1]
+        rows = Recipient.query.filter_by(message_id=message_id).all()
+        assert [pair for _, chunk in chunks for pair in chunk] == [(r.id, r.phone) for r in rows]
+        assert [len(chunk) for _, chunk in chunks] == [2, 1]
+
+    def test_send_bulk_sms_too_many_recipients(self, app, client, auth_headers):
+        """Test an oversized bulk send is rejected before anything is stored."""
+        app.config["SMS_BULK_MAX_RECIPIENTS"] = 2
+        response = client.post(
+            "/api/sms/send-bulk",
+            json={"recipients": ["85212345678"] * 3, "content": "Bulk test"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert response.json["error"]["code"] == "TOO_MANY_RECIPIENTS"
+        assert Message.query.count() == 0
+
+    def test_send_bulk_sms_queue_full_discards_message(self, client, auth_headers):
+        """Test a bulk send the queue cannot take leaves no pending rows behind."""
+        from unittest.mock import patch
+
+        from smspanel.services.queue import get_task_queue
+
+        with patch.object(get_task_queue(), "enqueue_many", return_value=False):
+            response = client.post(
+                "/api/sms/send-bulk",
+                json={"recipients": ["85212345678", "85287654321"], "content": "Bulk test"},
+                headers=auth_headers,
+            )
+        assert response.status_code == 503
+        assert Message.query.count() == 0
+        assert Recipient.query.count() == 0
+
     def test_get_message_unauthorized(self, client, test_message):
         """Test getting message details without authorization."""
         response = client.get(f"/api/sms/{test_message.id}")
@@ -126,3 +209,133 @@ class TestSMSAPI:
         assert data["success"] is True
         assert "recipients" in data["data"]
         assert len(data["data"]["recipients"]) >= 1
+
+    def test_list_messages_not_modified(self, client, auth_headers, test_message):
+        """Test polling with a matching ETag returns 304 until messages change."""
+        response = client.get("/api/sms", headers=auth_headers)
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        headers = {**auth_headers, "If-None-Match": etag}
+        response = client.get("/api/sms", headers=headers)
+        assert response.status_code == 304
+        assert response.data == b""
+
+        message = db.session.get(Message, test_message.id)
+        message.status = "pending"
+        db.session.commit()
+
+        response = client.get("/api/sms", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_list_messages_not_modified_skips_aggregates(self, app, client, auth_headers):
+        """Test a 304 is answered from the page rows without counting messages."""
+        from sqlalchemy import event
+
+        db.session.add(Message(user_id=auth_headers["user_id"], content="hello"))
+        db.session.commit()
+        etag = client.get("/api/sms", headers=auth_headers).headers["ETag"]
+
+        statements = []
+        engine = db.engine
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.get("/api/sms", headers={**auth_headers, "If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert response.status_code == 304
+        assert not any("count(" in sql or "sum(" in sql for sql in statements)
+
+    def test_list_messages_cursor_pagination(self, client, auth_headers):
+        """Test keyset pagination walks every message once without a total."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        # Two messages share a timestamp to exercise the id tie-break
+        for offset in (0, 0, 1, 2, 3):
+            db.session.add(
+                Message(
+                    user_id=auth_headers["user_id"],
+                    content=f"msg {offset}",
+                    created_at=base + timedelta(seconds=offset),
+                )
+            )
+        db.session.commit()
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            response = client.get(
+                "/api/sms", query_string={"cursor": cursor, "per_page": 2}, headers=auth_headers
+            )
+            assert response.status_code == 200
+            data = response.json["data"]
+            assert "total" not in data
+            seen.extend(m["id"] for m in data["messages"])
+            cursor = data["next_cursor"]
+
+        expected = [
+            m.id
+            for m in Message.query.filter_by(user_id=auth_headers["user_id"]).order_by(
+                Message.created_at.desc(), Message.id.asc()
+            )
+        ]
+        assert seen == expected
+        assert len(seen) == 5
+
+    def test_list_messages_cursor_clamps_per_page(self, client, auth_headers):
+        """Test out-of-range per_page values on the cursor path are clamped."""
+        from smspanel.api.sms import MAX_PER_PAGE
+
+        user_id = auth_headers["user_id"]
+        db.session.add_all(
+            Message(user_id=user_id, content=f"msg {i}") for i in range(MAX_PER_PAGE + 5)
+        )
+        db.session.commit()
+
+        response = client.get("/api/sms?cursor=&per_page=-5", headers=auth_headers)
+        data = response.json["data"]
+        assert len(data["messages"]) == 20
+        assert data["next_cursor"] is not None
+
+        response = client.get("/api/sms?cursor=&per_page=1000", headers=auth_headers)
+        data = response.json["data"]
+        assert len(data["messages"]) == MAX_PER_PAGE
+        assert data["next_cursor"] is not None
+
+    def test_list_messages_cursor_skips_count(self, client, auth_headers):
+        """Test cursor pages run no COUNT query."""
+        from sqlalchemy import event
+
+        statements = []
+        engine = db.engine
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.get("/api/sms?cursor=", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert response.status_code == 200
+        assert not any("count(" in sql for sql in statements)
+
+    def test_list_messages_invalid_cursor(self, client, auth_headers):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/sms?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json["error"]["code"] == "INVALID_CURSOR"
+
+    def test_send_sms_rejects_non_object_body(self, client, auth_headers):
+        """Test a JSON array body is rejected as invalid JSON."""
+        response = client.post("/api/sms", json=["recipient", "content"], headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json["error"]["code"] == "INVALID_JSON"
@@ -0,0 +1,34 @@
+"""Tests for web authentication."""
+
+from unittest.mock import patch
+
+from smspanel import db
+
+
+def test_load_user_runs_once_per_request(app, client, test_user):
+    """A protected page should load the logged-in user only once."""
+    from smspanel.web import auth
+
+    app.config["SECRET_KEY"] = "test-secret"
+    with client.session_transaction() as sess:
+        sess["_user_id"] = str(test_user.id)
+        sess["_fresh"] = True
+
+    with patch.object(auth.db.session, "get", wraps=auth.db.session.get) as mock_get:
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert mock_get.call_count == 1
+
+
+def test_load_user_uses_identity_map(app, test_user):
+    """Loading an already-loaded user should not query the database."""
+    from smspanel.models import User
+    from smspanel.web.auth import load_user
+
+    user = db.session.get(User, test_user.id)
+
+    with patch.object(db.session, "execute") as mock_execute:
+        assert load_user(str(test_user.id)) is user
+
+    mock_execute.assert_not_called()
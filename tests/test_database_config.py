@@ -30,3 +30,15 @@ def test_production_pool_settings():
     assert prod_config.SQLALCHEMY_POOL_MAX_OVERFLOW == 20
     assert prod_config.SQLALCHEMY_POOL_RECYCLE == 3600
     assert prod_config.SQLALCHEMY_POOL_PRE_PING is True
+
+
+def test_pool_settings_passed_to_engine():
+    """Pool settings should reach SQLAlchemy through SQLALCHEMY_ENGINE_OPTIONS."""
+    from smspanel.config.config import Config
+
+    options = Config.SQLALCHEMY_ENGINE_OPTIONS
+    assert options["pool_size"] == Config.SQLALCHEMY_POOL_SIZE
+    assert options["max_overflow"] == Config.SQLALCHEMY_POOL_MAX_OVERFLOW
+    assert options["pool_timeout"] == 30
+    assert options["pool_recycle"] == Config.SQLALCHEMY_POOL_RECYCLE
+    assert options["pool_pre_ping"] is True
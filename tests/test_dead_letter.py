@@ -55,13 +55,17 @@ def test_dead_letter_queue_add(app):
         assert msg.status == "pending"
 
 
-def test_dead_letter_admin_routes_exist(app):
+def test_dead_letter_admin_routes_exist():
     """Admin routes for dead letter should exist."""
+    from flask import Flask
+
     from smspanel.web.dead_letter import web_dead_letter_bp
 
     assert web_dead_letter_bp is not None
 
-    # Register blueprint with test app to get routes
+    # Register blueprint with a bare app to get routes (the shared test app
+    # has already served requests, so it can't take new blueprints)
+    app = Flask(__name__)
     app.register_blueprint(web_dead_letter_bp)
 
     # Check route registration
@@ -96,3 +96,31 @@ def test_internal_server_error_format(app):
         assert status == 500
         assert "error" in data
         assert data["error"]["code"] == "INTERNAL_ERROR"
+
+
+def test_success_response_serializes_datetimes(app):
+    """Success responses should encode datetimes as ISO 8601 strings."""
+    from datetime import datetime, timezone
+
+    from smspanel.api.responses import APIResponse
+
+    created_at = datetime(2026, 1, 22, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    with app.app_context():
+        response, status = APIResponse.success({"created_at": created_at})
+        data = response.get_json()
+
+        assert response.mimetype == "application/json"
+        assert data["data"]["created_at"] == created_at.isoformat()
+
+
+def test_repeated_error_reuses_serialized_body(app):
+    """Identical errors should be served from the cached body."""
+    from smspanel.api.responses import _error_body, bad_request
+
+    with app.app_context():
+        _error_body.cache_clear()
+        first, _ = bad_request()
+        second, _ = bad_request()
+
+        assert first.get_data() == second.get_data()
+        assert _error_body.cache_info().hits == 1
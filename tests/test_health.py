@@ -1,54 +1,93 @@
 """Health check endpoint tests."""
 
 
-def test_health_endpoint_exists(app):
+def test_health_endpoint_exists(client):
     """Health check endpoint should exist."""
-    with app.test_client() as client:
-        response = client.get("/api/health")
-        assert response.status_code in [200, 503]
+    response = client.get("/api/health")
+    assert response.status_code in [200, 503]
 
-        data = response.get_json()
-        assert "status" in data
-        assert data["status"] in ["healthy", "unhealthy"]
+    data = response.get_json()
+    assert "status" in data
+    assert data["status"] in ["healthy", "unhealthy"]
 
 
-def test_health_endpoint_returns_details(app):
+def test_health_endpoint_returns_details(app, client):
     """Health check should return system details."""
-    with app.test_client() as client:
-        response = client.get("/api/health")
-        data = response.get_json()
+    response = client.get("/api/health")
+    data = response.get_json()
 
-        # Should include key health indicators
-        assert "timestamp" in data
-        assert "checks" in data
-        assert "version" in data
+    # Should include key health indicators
+    assert "timestamp" in data
+    assert "checks" in data
+    assert "version" in data
+    assert data["version"] == app.config["APP_VERSION"]
 
 
-def test_health_endpoint_database_check(app):
+def test_health_endpoint_database_check(client):
     """Health check should verify database connectivity."""
-    with app.test_client() as client:
-        response = client.get("/api/health")
-        data = response.get_json()
+    response = client.get("/api/health")
+    data = response.get_json()
 
-        assert "database" in data["checks"]
-        assert "healthy" in data["checks"]["database"]
+    assert "database" in data["checks"]
+    assert "healthy" in data["checks"]["database"]
 
 
-def test_liveness_endpoint_exists(app):
+def test_liveness_endpoint_exists(client):
     """Liveness probe endpoint should exist."""
-    with app.test_client() as client:
-        response = client.get("/api/health/live")
-        assert response.status_code == 200
+    response = client.get("/api/health/live")
+    assert response.status_code == 200
 
-        data = response.get_json()
-        assert data["status"] == "alive"
+    data = response.get_json()
+    assert data["status"] == "alive"
 
 
-def test_readiness_endpoint_exists(app):
+def test_readiness_endpoint_exists(client):
     """Readiness probe endpoint should exist."""
-    with app.test_client() as client:
-        response = client.get("/api/health/ready")
-        assert response.status_code in [200, 503]
+    response = client.get("/api/health/ready")
+    assert response.status_code in [200, 503]
+
+    data = response.get_json()
+    assert "status" in data
+
+
+def test_database_check_is_cached(client):
+    """Repeated health checks within the TTL should share one database query."""
+    from unittest.mock import patch
+
+    from smspanel.api import health
+
+    health._db_check_cache["checked_at"] = float("-inf")
+    health._health_body_cache["built_at"] = float("-inf")
+    with patch.object(health.db.session, "execute") as mock_execute:
+        client.get("/api/health")
+        client.get("/api/health/ready")
+        client.get("/api/health")
+
+    assert mock_execute.call_count == 1
+
+
+def test_liveness_does_not_touch_database(client):
+    """Liveness should stay up even when the database is unreachable."""
+    from unittest.mock import patch
+
+    from smspanel.api import health
+
+    with patch.object(health.db.session, "execute", side_effect=Exception("down")) as mock:
+        response = client.get("/api/health/live")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "alive"}
+    mock.assert_not_called()
+
+
+def test_health_body_is_reused_within_ttl(client):
+    """Health checks within the TTL should return the same serialized body."""
+    from smspanel.api import health
+
+    health._health_body_cache["built_at"] = float("-inf")
+    first = client.get("/api/health")
+    second = client.get("/api/health")
 
-        data = response.get_json()
-        assert "status" in data
+    assert first.data == second.data
+    assert first.status_code == second.status_code
+    assert first.mimetype == "application/json"
@@ -49,10 +49,10 @@ class TestHKTSMSService:
             assert config.application_id == app.config["SMS_APPLICATION_ID"]
             assert config.sender_number == app.config["SMS_SENDER_NUMBER"]
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_single_success(self, mock_post, app):
         """Test successful single SMS send."""
-        mock_post.side_effect = MockHKTPost(failure_rate=0, min_delay=0, max_delay=0)
+        mock_post.side_effect = MockHKTPost.for_unit_tests()
         config_service = ConfigService(
             base_url="https://test.com", application_id="test-app", sender_number="12345"
         )
@@ -65,10 +65,10 @@ class TestHKTSMSService:
         call_args = mock_post.call_args[0][0]
         assert call_args == "https://test.com"
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_single_http_error(self, mock_post, app):
         """Test single SMS send with HTTP error."""
-        mock_post.side_effect = MockHKTPost(failure_rate=1.0, min_delay=0, max_delay=0)
+        mock_post.side_effect = MockHKTPost(failure_rate=1.0)
         config_service = ConfigService(
             base_url="https://test.com", application_id="test-app", sender_number="12345"
         )
@@ -77,10 +77,10 @@ class TestHKTSMSService:
         assert result["success"] is False
         assert "error" in result
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_single_with_unicode(self, mock_post, app):
         """Test single SMS send with Unicode characters."""
-        mock_post.side_effect = MockHKTPost(failure_rate=0, min_delay=0, max_delay=0)
+        mock_post.side_effect = MockHKTPost.for_unit_tests()
         config_service = ConfigService(
             base_url="https://test.com", application_id="test-app", sender_number="12345"
         )
@@ -90,10 +90,10 @@ class TestHKTSMSService:
         assert result["status_code"] == 200
         assert "SUCCESS" in result["response_text"]
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_bulk_all_success(self, mock_post, app):
         """Test bulk SMS send with all successful."""
-        mock_post.side_effect = MockHKTPost(failure_rate=0, min_delay=0, max_delay=0)
+        mock_post.side_effect = MockHKTPost.for_unit_tests()
         config_service = ConfigService(
             base_url="https://test.com", application_id="test-app", sender_number="12345"
         )
@@ -107,14 +107,13 @@ class TestHKTSMSService:
         assert len(result["results"]) == 2
         assert all(r["success"] for r in result["results"])
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_bulk_partial_failure(self, mock_post, app):
         """Test bulk SMS send with partial failures."""
-        call_count = [0]
 
+        # Bulk sends run concurrently, so fail by recipient rather than call order
         def side_effect_func(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
+            if kwargs["data"]["mrt"] == "85212345678":
                 return MockSMSResponse(status_code=200, text="SUCCESS")
             else:
                 from requests.exceptions import RequestException
@@ -135,7 +134,7 @@ class TestHKTSMSService:
         assert result["results"][0]["success"] is True
         assert result["results"][1]["success"] is False
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_bulk_empty_list(self, mock_post, app):
         """Test bulk SMS send with empty recipient list."""
         config_service = ConfigService(
@@ -150,7 +149,7 @@ class TestHKTSMSService:
         assert result["results"] == []
         mock_post.assert_not_called()
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_single_handles_error_with_response(self, mock_post, app):
         """send_single should handle errors with response attribute correctly."""
         # Create a mock response object
@@ -172,7 +171,7 @@ class TestHKTSMSService:
         assert result["success"] is False
         assert result["status_code"] == 400
 
-    @patch("smspanel.services.hkt_sms.requests.post")
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
     def test_send_single_handles_error_without_response(self, mock_post, app):
         """send_single should handle errors without response attribute correctly."""
         # Create a RequestException without response attribute
@@ -190,3 +189,56 @@ class TestHKTSMSService:
 
         assert result["success"] is False
         assert result["status_code"] is None
+
+    def test_session_pools_gateway_connections(self):
+        """Service should reuse one pooled session for all gateway requests."""
+        from smspanel.services.hkt_sms import SMS_POOL_SIZE
+
+        config_service = ConfigService(
+            base_url="https://test.com", application_id="test-app", sender_number="12345"
+        )
+        service = HKTSMSService(config_service)
+        adapter = service.session.get_adapter("https://test.com")
+        assert adapter._pool_maxsize == SMS_POOL_SIZE
+
+    def test_session_sets_socket_options(self):
+        """Gateway connections should disable Nagle and enable TCP keepalive."""
+        from smspanel.services.hkt_sms import SMS_SOCKET_OPTIONS
+
+        config_service = ConfigService(
+            base_url="https://test.com", application_id="test-app", sender_number="12345"
+        )
+        service = HKTSMSService(config_service)
+        adapter = service.session.get_adapter("https://test.com")
+        assert adapter.poolmanager.connection_pool_kw["socket_options"] == SMS_SOCKET_OPTIONS
+
+    @patch("smspanel.services.hkt_sms.requests.Session.post")
+    def test_send_bulk_runs_requests_concurrently(self, mock_post):
+        """Bulk sends should overlap gateway requests and keep result order."""
+        import threading
+        import time
+
+        in_flight = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def side_effect_func(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return MockSMSResponse(status_code=200, text=kwargs["data"]["mrt"])
+
+        mock_post.side_effect = side_effect_func
+        config_service = ConfigService(
+            base_url="https://test.com", application_id="test-app", sender_number="12345"
+        )
+        service = HKTSMSService(config_service, bulk_concurrency=4)
+        recipients = [f"8521234{i:04d}" for i in range(8)]
+        result = service.send_bulk(recipients, "Test bulk message")
+
+        assert result["successful"] == 8
+        assert [r["response"] for r in result["results"]] == recipients
+        assert 1 < peak[0] <= 4
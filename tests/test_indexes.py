@@ -19,3 +19,22 @@ def test_message_compound_index_exists():
     )
 
     assert has_compound_idx, "Compound index on (user_id, created_at) should exist"
+
+
+def test_message_compound_index_orders_created_at_desc():
+    """Compound index should store created_at descending to match list ordering."""
+    from smspanel.models import Message
+
+    idx = next(i for i in Message.__table__.indexes if i.name == "ix_messages_user_id_created_at")
+    expressions = [str(e) for e in idx.expressions]
+
+    assert expressions[0] == "messages.user_id"
+    assert expressions[1] == "created_at DESC"
+
+
+def test_user_compound_index_exists():
+    """User table should have compound index on (is_admin, username)."""
+    from smspanel.models import User
+
+    idx = next(i for i in User.__table__.indexes if i.name == "ix_users_is_admin_username")
+    assert [c.name for c in idx.columns] == ["is_admin", "username"]
@@ -24,3 +24,21 @@ def test_message_job_status_fields(app):
         assert msg.job_status == MessageJobStatus.PENDING
         assert msg.queue_position is None
         assert msg.estimated_complete_at is None
+
+
+def test_message_job_status_stored_as_code(app):
+    """job_status should be stored as a small integer and loaded as the enum."""
+    from smspanel.models import JOB_STATUS_CODES, Message
+
+    msg = Message(user_id=1, content="Test", job_status=MessageJobStatus.PARTIAL)
+    db.session.add(msg)
+    db.session.commit()
+
+    stored = db.session.execute(
+        db.text("SELECT job_status FROM messages WHERE id = :id"), {"id": msg.id}
+    ).scalar_one()
+    assert stored == JOB_STATUS_CODES[MessageJobStatus.PARTIAL]
+
+    db.session.expire_all()
+    assert db.session.get(Message, msg.id).job_status is MessageJobStatus.PARTIAL
+    assert Message.query.filter_by(job_status="partial").count() == 1
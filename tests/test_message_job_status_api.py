@@ -1,19 +1,14 @@
 """Tests for job status fields in message API endpoint."""
 
 from smspanel import db
-from smspanel.models import User, Message, MessageJobStatus
+from smspanel.models import Message, MessageJobStatus
 
 
-def test_get_message_includes_job_status(app):
+def test_get_message_includes_job_status(app, client, auth_headers):
     """GET /api/sms/{id} should include job_status and queue info."""
     with app.app_context():
-        user = User(username="test", password_hash="x", is_admin=False)
-        user.token = User.generate_token()
-        db.session.add(user)
-        db.session.commit()
-
         msg = Message(
-            user_id=user.id,
+            user_id=auth_headers["user_id"],
             content="Test message",
             job_status=MessageJobStatus.PENDING,
             queue_position=5,
@@ -21,14 +16,13 @@ def test_get_message_includes_job_status(app):
         db.session.add(msg)
         db.session.commit()
 
-        with app.test_client() as client:
-            response = client.get(
-                f"/api/sms/{msg.id}", headers={"Authorization": f"Bearer {user.token}"}
-            )
-            assert response.status_code == 200
-            data = response.get_json()
-            assert data["success"] is True
-            assert "data" in data
-            assert data["data"]["job_status"] == "pending"
-            assert data["data"]["queue_position"] == 5
-            assert "estimated_complete_at" in data["data"]
+        response = client.get(
+            f"/api/sms/{msg.id}", headers={"Authorization": auth_headers["Authorization"]}
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["success"] is True
+        assert "data" in data
+        assert data["data"]["job_status"] == "pending"
+        assert data["data"]["queue_position"] == 5
+        assert "estimated_complete_at" in data["data"]
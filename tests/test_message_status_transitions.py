@@ -10,7 +10,7 @@ def test_message_status_transitions_on_send(app):
 
         user = User(username="test", password_hash="x", is_admin=False)
         db.session.add(user)
-        db.session.commit()
+        db.session.flush()  # Assigns user.id; committed together with the message
 
         msg = Message(
             user_id=user.id,
@@ -1,16 +1,52 @@
 """Tests for the queue status API endpoint."""
 
 
-def test_queue_status_endpoint_exists(app):
+def test_queue_status_endpoint_exists(client):
     """Queue status endpoint should return queue statistics."""
-    with app.test_client() as client:
-        response = client.get("/api/queue/status")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["success"] is True
-        assert "data" in data
-        assert "queue_depth" in data["data"]
-        assert "msgs_per_sec" in data["data"]
-        assert "pending_messages" in data["data"]
-        assert "sending_messages" in data["data"]
-        assert "oldest_pending_at" in data["data"]
+    response = client.get("/api/queue/status")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["success"] is True
+    assert "data" in data
+    assert "queue_depth" in data["data"]
+    assert "msgs_per_sec" in data["data"]
+    assert "pending_messages" in data["data"]
+    assert "sending_messages" in data["data"]
+    assert "oldest_pending_at" in data["data"]
+
+
+def test_queue_status_counts_messages(client, auth_headers):
+    """Queue status should count pending and sending messages."""
+    from datetime import datetime
+
+    from smspanel import db
+    from smspanel.models import Message, MessageJobStatus
+
+    user_id = auth_headers["user_id"]
+    oldest = datetime(2026, 1, 1, 8, 0, 0)
+    pending = MessageJobStatus.PENDING
+    db.session.add_all(
+        [
+            Message(user_id=user_id, content="a", job_status=pending, created_at=oldest),
+            Message(
+                user_id=user_id,
+                content="b",
+                job_status=pending,
+                created_at=datetime(2026, 1, 1, 9, 0, 0),
+            ),
+            Message(
+                user_id=user_id,
+                content="c",
+                job_status=MessageJobStatus.SENDING,
+                created_at=datetime(2026, 1, 1, 7, 0, 0),
+            ),
+            Message(user_id=user_id, content="d", job_status=MessageJobStatus.COMPLETED),
+        ]
+    )
+    db.session.commit()
+
+    data = client.get("/api/queue/status").get_json()["data"]
+
+    assert data["pending_messages"] == 2
+    assert data["sending_messages"] == 1
+    assert data["oldest_pending_at"].startswith(oldest.isoformat())
@@ -28,7 +28,7 @@ def test_send_single_retries_on_connection_error(app):
             raise ConnectionError("Simulated connection error")
         return MagicMock(status_code=200, text="SUCCESS", raise_for_status=MagicMock())
 
-    with patch("smspanel.services.hkt_sms.requests.post", side_effect=mock_post):
+    with patch("smspanel.services.hkt_sms.requests.Session.post", side_effect=mock_post):
         config_service = ConfigService(
             base_url="https://test.com", application_id="test-app", sender_number="12345"
         )
@@ -2,14 +2,16 @@
 
 import inspect
 
+from smspanel.app import _ensure_admin_user
+
+# Read and parse the source file once for the module
+_ENSURE_ADMIN_SRC = inspect.getsource(_ensure_admin_user)
+
 
 def test_admin_credentials_not_hardcoded():
     """Admin username/password should not be hardcoded in source."""
-    from smspanel.app import _ensure_admin_user
-
-    source = inspect.getsource(_ensure_admin_user)
     # Should not contain hardcoded credentials
-    assert "SMSpass#12" not in source
+    assert "SMSpass#12" not in _ENSURE_ADMIN_SRC
 
 
 def test_production_secret_key_not_default():
@@ -26,7 +28,9 @@ def test_env_documentation_exists():
     """Environment variables should be documented."""
     import os
 
-    docs_exist = os.path.exists(".env.example") or "ADMIN_PASSWORD" in (
-        open("README.md").read() if os.path.exists("README.md") else ""
-    )
-    assert docs_exist, "ADMIN_PASSWORD env var should be documented"
+    if os.path.exists(".env.example"):
+        return
+
+    assert os.path.exists("README.md"), "ADMIN_PASSWORD env var should be documented"
+    with open("README.md", encoding="utf-8") as f:
+        assert "ADMIN_PASSWORD" in f.read(), "ADMIN_PASSWORD env var should be documented"
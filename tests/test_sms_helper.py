@@ -0,0 +1,83 @@
+"""Tests for SMS helper utilities."""
+
+from smspanel import db
+from smspanel.models import Message, Recipient, User
+from smspanel.utils.sms_helper import update_message_status_from_result
+
+
+def test_update_message_status_from_result_updates_recipients(app):
+    """Bulk result should update each recipient in insertion order."""
+    user = User(username="helper", password_hash="x")
+    db.session.add(user)
+    db.session.commit()
+
+    message = Message(user_id=user.id, content="Test", status="pending", recipient_count=2)
+    db.session.add(message)
+    db.session.flush()
+    db.session.bulk_insert_mappings(
+        Recipient,
+        [
+            {"message_id": message.id, "phone": phone, "status": "pending"}
+            for phone in ("11111111", "22222222")
+        ],
+    )
+    db.session.commit()
+
+    result = {
+        "success": False,
+        "total": 2,
+        "successful": 1,
+        "failed": 1,
+        "results": [
+            {"recipient": "11111111", "success": True, "error": None},
+            {"recipient": "22222222", "success": False, "error": "Rejected"},
+        ],
+    }
+    update_message_status_from_result(message, result)
+    db.session.commit()
+
+    rows = {r.phone: r for r in Recipient.query.filter_by(message_id=message.id)}
+    assert message.status == "partial"
+    assert rows["11111111"].status == "sent"
+    assert rows["22222222"].status == "failed"
+    assert rows["22222222"].error_message == "Rejected"
+    assert (message.success_count, message.failed_count) == (1, 1)
+
+
+def test_bulk_chunks_set_final_status_after_last_chunk(app):
+    """Each chunk updates its own recipients; the last one sets message status."""
+    from unittest.mock import MagicMock, patch
+
+    from smspanel.utils.sms_helper import process_bulk_sms_chunk_task
+
+    user = User(username="chunker", password_hash="x")
+    db.session.add(user)
+    db.session.commit()
+
+    phones = ["11111111", "22222222", "33333333"]
+    message = Message(user_id=user.id, content="Test", status="pending", recipient_count=3)
+    db.session.add(message)
+    db.session.flush()
+    records = [Recipient(message_id=message.id, phone=phone, status="pending") for phone in phones]
+    db.session.add_all(records)
+    db.session.commit()
+    message_id = message.id
+    pairs = [(record.id, record.phone) for record in records]
+
+    service = MagicMock()
+    service.send_bulk.side_effect = lambda recipients, content: {
+        "results": [
+            {"recipient": r, "success": r != "33333333", "error": "Rejected"} for r in recipients
+        ]
+    }
+    with patch("smspanel.utils.sms_helper.get_sms_service", return_value=service):
+        process_bulk_sms_chunk_task(message_id, pairs[2:])
+        assert db.session.get(Message, message_id).status == "pending"
+
+        process_bulk_sms_chunk_task(message_id, pairs[:2])
+
+    rows = {r.phone: r.status for r in Recipient.query.filter_by(message_id=message_id)}
+    assert rows == {"11111111": "sent", "22222222": "sent", "33333333": "failed"}
+    message = db.session.get(Message, message_id)
+    assert message.status == "partial"
+    assert (message.recipient_count, message.success_count, message.failed_count) == (3, 2, 1)
@@ -0,0 +1,25 @@
+"""Tests for TaskQueue enqueueing."""
+
+from smspanel.services.queue import TaskQueue
+
+
+def _task(*args):
+    pass
+
+
+def test_enqueue_many_adds_all_tasks():
+    """enqueue_many should queue every task in order."""
+    task_queue = TaskQueue(num_workers=1, max_queue_size=3)
+
+    assert task_queue.enqueue_many(_task, [(1,), (2,), (3,)]) is True
+    assert task_queue.get_queue_size() == 3
+    assert [task_queue.queue.get_nowait()[1] for _ in range(3)] == [(1,), (2,), (3,)]
+
+
+def test_enqueue_many_is_all_or_nothing():
+    """enqueue_many should reject the batch when it does not fit."""
+    task_queue = TaskQueue(num_workers=1, max_queue_size=3)
+    task_queue.enqueue(_task, 0)
+
+    assert task_queue.enqueue_many(_task, [(1,), (2,), (3,)]) is False
+    assert task_queue.get_queue_size() == 1
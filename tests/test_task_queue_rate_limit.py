@@ -3,10 +3,16 @@
 
 def test_task_queue_uses_rate_limiter(app):
     """TaskQueue should integrate with rate limiter."""
+    from smspanel.services import queue as queue_module
     from smspanel.services.queue import init_task_queue, get_task_queue
 
+    original = get_task_queue()
     init_task_queue(app, num_workers=1)
     queue = get_task_queue()
-
-    assert queue.rate_limiter is not None
-    assert isinstance(queue.rate_limiter.get_tokens(), float)
+    try:
+        assert queue.rate_limiter is not None
+        assert isinstance(queue.rate_limiter.get_tokens(), float)
+    finally:
+        # Stop the live worker and put back the shared worker-less queue
+        queue.stop()
+        queue_module._task_queue = original
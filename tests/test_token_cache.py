@@ -0,0 +1,82 @@
+"""Tests for API token cache."""
+
+import time
+
+from smspanel import db
+from smspanel.models import User
+from smspanel.utils.token_cache import TokenCache, get_token_cache
+
+
+def test_token_cache_set_and_get():
+    """TokenCache should return the cached user ID."""
+    cache = TokenCache()
+    cache.set("token-a", 1)
+    assert cache.get("token-a") == 1
+    assert cache.get("token-b") is None
+
+
+def test_token_cache_expires_entries():
+    """TokenCache entries should expire after ttl."""
+    cache = TokenCache(ttl=0.05)
+    cache.set("token-a", 1)
+    time.sleep(0.1)
+    assert cache.get("token-a") is None
+
+
+def test_token_cache_evicts_oldest_when_full():
+    """TokenCache should evict the oldest entry when maxsize is reached."""
+    cache = TokenCache(maxsize=2)
+    cache.set("token-a", 1)
+    cache.set("token-b", 2)
+    cache.set("token-c", 3)
+    assert cache.get("token-a") is None
+    assert cache.get("token-b") == 2
+    assert cache.get("token-c") == 3
+
+
+def test_token_cache_invalidate():
+    """TokenCache.invalidate should drop the token and ignore None."""
+    cache = TokenCache()
+    cache.set("token-a", 1)
+    cache.invalidate("token-a")
+    cache.invalidate(None)
+    assert cache.get("token-a") is None
+
+
+def test_api_rejects_replaced_token(client, auth_headers):
+    """A token should stop working once it is replaced and invalidated."""
+    response = client.get("/api/sms", headers=auth_headers)
+    assert response.status_code == 200
+    old_token = auth_headers["Authorization"].split(" ")[1]
+    assert get_token_cache().get(old_token) == auth_headers["user_id"]
+
+    user = db.session.get(User, auth_headers["user_id"])
+    user.token = User.generate_token()
+    db.session.commit()
+    # As the admin regenerate_token view does
+    get_token_cache().invalidate(old_token)
+
+    response = client.get("/api/sms", headers=auth_headers)
+    assert response.status_code == 401
+
+
+def test_cached_token_skips_user_lookup(app, client, auth_headers):
+    """A cached token should be resolved without querying the users table."""
+    from sqlalchemy import event
+
+    client.get("/api/sms", headers=auth_headers)
+
+    statements = []
+    engine = db.engine
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement.lower())
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/api/sms", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert not any("from users" in sql for sql in statements)
@@ -1,24 +1,18 @@
 import os
 import smspanel
 
+_PKG_DIR = os.path.dirname(smspanel.__file__)
+_PY_TYPED = os.path.join(_PKG_DIR, "py.typed")
+
 
 def test_py_typed_marker_exists():
     """Package should include py.typed marker for type checking."""
-    package_dir = os.path.dirname(smspanel.__file__)
-    py_typed_path = os.path.join(package_dir, "py.typed")
-
-    assert os.path.exists(py_typed_path), "py.typed marker should exist"
+    assert os.path.exists(_PY_TYPED), "py.typed marker should exist"
 
 
 def test_py_typed_marker_is_empty_or_has_comment():
     """py.typed marker should be empty or contain a comment."""
-    import smspanel
-    import os
-
-    package_dir = os.path.dirname(smspanel.__file__)
-    py_typed_path = os.path.join(package_dir, "py.typed")
-
-    with open(py_typed_path) as f:
+    with open(_PY_TYPED) as f:
         content = f.read().strip()
 
     # Should be empty or have a comment
@@ -27,8 +21,6 @@ def test_py_typed_marker_is_empty_or_has_comment():
 
 def test_package_marked_as_type_checked():
     """Package should be properly structured for type checking."""
-    import smspanel
-
     # Verify package is importable
     assert smspanel is not None
 
@@ -0,0 +1,24 @@
+"""Tests for SMS composition validation."""
+
+from smspanel.utils.validation import validate_recipients
+
+
+def test_validate_recipients_partitions_lines():
+    """Test valid and invalid numbers are split, keeping input order."""
+    valid, invalid = validate_recipients("1234 5678\n12345678\nabc\n123\n8765 4321")
+    assert valid == ["1234 5678", "12345678", "8765 4321"]
+    assert invalid == ["abc", "123"]
+
+
+def test_validate_recipients_strips_crlf_and_blank_lines():
+    """Test CRLF line endings, padding and blank lines are handled."""
+    valid, invalid = validate_recipients("  12345678 \r\n\r\n\n9876 5432\r\n")
+    assert valid == ["12345678", "9876 5432"]
+    assert invalid == []
+
+
+def test_validate_recipients_does_not_join_lines():
+    """Test two half numbers on separate lines are not matched as one."""
+    valid, invalid = validate_recipients("1234\n5678")
+    assert valid == []
+    assert invalid == ["1234", "5678"]